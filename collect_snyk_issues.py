@@ -38,53 +38,257 @@ Usage:
 import requests
 import json
 import argparse
+import asyncio
+import atexit
+import contextlib
+import io
+import logging
+import logging.handlers
 import time
 import os
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+from urllib.parse import urljoin
 import random
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# httpx is only used for HTTP/2 (--http2), which also needs the h2 package
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+# Only advertise brotli when a decoder is installed; gzip and deflate always work
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+# Use orjson for (de)serialization when available; it is several times faster than json
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        """Serialize obj to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode()
+
+# Org slugs rarely change, so they are remembered across runs for SLUG_CACHE_TTL seconds
+SLUG_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'snyk_org_slug.json')
+SLUG_CACHE_TTL = 86400
+
+# Issue detail responses are cached between runs for DETAIL_CACHE_TTL seconds
+DETAIL_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'snyk_issue_details.sqlite')
+DETAIL_CACHE_TTL = 3600
+
+
+# Messages logged outside an organization's block go straight to stdout; each
+# organization gets a buffered child logger from _org_logger
+logger = logging.getLogger('snyk')
+logger.setLevel(logging.DEBUG)
+logger.propagate = False
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_stdout_handler)
+
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def _parse_retry_after(value: Optional[str], default: float = 61.0) -> float:
+    """Parse a Retry-After header given in seconds, falling back to Snyk's 61-second backoff."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _absolutize(base_url: str, url: Optional[str]) -> Optional[str]:
+    """Resolve a pagination link, absolute or relative to the API host, against base_url."""
+    return urljoin(base_url + '/', url) if url else None
+
+
+class IssueDetailCache:
+    """
+    On-disk SQLite cache of issue detail responses, keyed by
+    (org_id, project_id, issue_id, version). Entries older than expire_after
+    seconds are treated as missing. Safe to share between threads.
+    """
+
+    def __init__(self, path: str = DETAIL_CACHE_FILE, expire_after: int = DETAIL_CACHE_TTL):
+        self.expire_after = expire_after
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # Losing the last few writes on a crash is fine for a cache
+        self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS issue_details ("
+            " org_id TEXT, project_id TEXT, issue_id TEXT, version TEXT,"
+            " fetched_at REAL, body BLOB,"
+            " PRIMARY KEY (org_id, project_id, issue_id, version))"
+        )
+        self._conn.commit()
+        atexit.register(self.close)
+
+    def get(self, org_id: str, project_id: str, issue_id: str, version: str) -> Optional[Dict]:
+        """Return the cached issue details, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body FROM issue_details WHERE org_id = ? AND project_id = ?"
+                    " AND issue_id = ? AND version = ? AND fetched_at >= ?",
+                    (org_id, project_id, issue_id, version, time.time() - self.expire_after)
+                ).fetchone()
+            return _loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(self, org_id: str, project_id: str, issue_id: str, version: str, details: Dict):
+        """Store issue details in the cache."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO issue_details VALUES (?, ?, ?, ?, ?, ?)",
+                    (org_id, project_id, issue_id, version, time.time(), _dumps(details))
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class IssueListingError(Exception):
+    """Raised when a page of an organization's issues list cannot be fetched."""
+
 
 class SnykAPI:
     """Snyk API client for collecting issues."""
     
-    def __init__(self, token: str, region: str = "SNYK-US-01"):
+    def __init__(self, token: str, region: str = "SNYK-US-01", slug_cache: bool = True):
         self.token = token
         self.base_url = self._get_base_url(region)
         
-        # Create session with retry logic and connection pooling
-        self.session = requests.Session()
-        
         # Configure retry strategy
         retry_strategy = Retry(
-            total=3,  # Maximum number of retries
-            backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
-            status_forcelist=[500, 502, 503, 504],  # Retry on server errors (not 429)
-            allowed_methods=["GET", "POST"],  # Only retry safe methods
+            total=5,  # Maximum number of retries
+            backoff_factor=0.5,  # Wait 0.5, 1, 2, 4, 8 seconds between retries
+            status_forcelist=[429, 500, 502, 503, 504],  # Retry on rate limiting and server errors
+            allowed_methods=["GET"],  # Only retry safe methods
             respect_retry_after_header=True,  # Respect rate limit headers
+            raise_on_status=False,  # Hand the last response back so callers can handle 429s
         )
         
-        # Configure connection pooling
+        # Create session with retry logic and connection pooling
+        self.session = self._new_session(retry_strategy)
+        
+        # requests has no session-wide timeout, so this is passed on every call
+        self.timeout = (30, 60)  # (connect_timeout, read_timeout)
+        
+        # Issue detail requests are retried by get_issue_details itself, which applies
+        # Snyk's 429 backoff; their session must not retry as well or attempts multiply
+        self.detail_session = self._new_session(0)
+        
+        # Attempts per issue detail request
+        self.max_attempts = 5
+        
+        # Optional IssueDetailCache consulted before fetching issue details
+        self.detail_cache = None
+        
+        # Memoized org_id -> [slug, fetched_at] lookups, persisted to disk on exit
+        # unless slug_cache is False
+        self._slug_cache = self._load_slug_cache() if slug_cache else {}
+        self._slug_cache_dirty = False
+        if slug_cache:
+            atexit.register(self._save_slug_cache)
+    
+    def _new_session(self, max_retries) -> requests.Session:
+        """Create an authenticated session with a connection pool and the given adapter retries."""
+        session = requests.Session()
+        
+        # Configure connection pooling, sized for concurrent callers sharing this session
         adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,  # Number of connection pools to cache
-            pool_maxsize=20,      # Maximum number of connections per pool
+            max_retries=max_retries,
+            pool_connections=50,  # Number of connection pools to cache
+            pool_maxsize=50,      # Maximum number of connections per pool
         )
         
-        # Set reasonable timeouts
-        self.session.timeout = (30, 60)  # (connect_timeout, read_timeout)
-        
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         
         # Set headers
-        self.session.headers.update({
+        session.headers.update({
             'Authorization': f'token {self.token}',
-            'Accept': '*/*'
+            'Accept': 'application/vnd.api+json',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        return session
+    
+    def _load_slug_cache(self) -> Dict[str, list]:
+        """
+        Load the org slug cache from disk, dropping entries older than SLUG_CACHE_TTL.
+        Returns an empty cache if the file is missing or unreadable.
+        """
+        try:
+            with open(SLUG_CACHE_FILE, 'rb') as f:
+                cache = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        oldest = time.time() - SLUG_CACHE_TTL
+        return {org_id: entry for org_id, entry in cache.items()
+                if isinstance(entry, list) and len(entry) == 2
+                and isinstance(entry[1], (int, float)) and entry[1] >= oldest}
+    
+    def _save_slug_cache(self):
+        """Write the org slug cache back to disk if any new slugs were learned."""
+        if not self._slug_cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(SLUG_CACHE_FILE), exist_ok=True)
+            with open(SLUG_CACHE_FILE, 'wb') as f:
+                f.write(_dumps(self._slug_cache))
+            self._slug_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not save org slug cache: {e}")
+    
+    def _remember_slug(self, org_id: str, slug: str):
+        """Record a freshly fetched slug for org_id in the slug cache."""
+        self._slug_cache[org_id] = [slug, time.time()]
+        self._slug_cache_dirty = True
     
     def _get_base_url(self, region: str) -> str:
         """Get the appropriate API base URL for the region."""
@@ -96,10 +300,18 @@ class SnykAPI:
         }
         return region_urls.get(region, "https://api.snyk.io")
     
-    def get_issues_for_org(self, org_id: str, issue_type: str = "code", version: str = "2024-10-15") -> Dict:
+    def get_issues_for_org(self, org_id: str, issue_type: str = "code", version: str = "2024-10-15",
+                           transform: Optional[Callable[[Dict], object]] = None,
+                           log: Optional[logging.Logger] = None) -> Dict:
         """
         Get all issues for a single Snyk organization, handling pagination.
+        If transform is given, each issue is passed through it as its page arrives
+        and only the result is kept, so the full page payloads can be freed.
+        Raises IssueListingError on a client error or once a page has failed
+        max_attempts times, so a partial list is never mistaken for the whole one.
+        Errors are reported through log (the module logger by default).
         """
+        log = log or logger
         url = f"{self.base_url}/rest/orgs/{org_id}/issues"
         params = {
             'version': version,
@@ -110,41 +322,41 @@ class SnykAPI:
         all_data = []
         next_url = url
         next_params = params
+        attempt = 0
         while next_url:
             try:
-                response = self.session.get(next_url, params=next_params)
+                response = self.session.get(next_url, params=next_params, timeout=self.timeout)
                 response.raise_for_status()
-                data = response.json()
-                all_data.extend(data.get('data', []))
-                links = data.get('links', {})
-                next_url = links.get('next')
+                data = _loads(response.content)
+                page = data.get('data', [])
+                if transform is not None:
+                    page = [transform(issue) for issue in page]
+                all_data += page
+                next_url = _absolutize(self.base_url, data.get('links', {}).get('next'))
                 next_params = None
-                if next_url:
-                    if next_url.startswith('http'):
-                        pass  # use as-is
-                    elif next_url.startswith('/'):
-                        next_url = self.base_url + next_url
-                    else:
-                        next_url = self.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
-            except requests.exceptions.RequestException as e:
-                print(f"   ❌ Error fetching issues for org {org_id}: {e}")
+                attempt = 0
+            except (requests.exceptions.RequestException, ValueError) as e:
+                log.warning("   ❌ Error fetching issues for org %s: %s", org_id, e)
+                attempt += 1
+                status = None
                 if hasattr(e, 'response') and e.response is not None:
-                    print(f"      Status code: {e.response.status_code}")
-                    if e.response.status_code == 429:  # Rate limited
-                        print(f"      🚫 Rate limited by Snyk - waiting 61 seconds...")
-                        time.sleep(61)  # Snyk requires at least 61 seconds
-                    elif e.response.status_code >= 500:  # Server error
-                        print(f"      Server error - waiting 2 seconds...")
-                        time.sleep(2)
-                    else:
-                        # Wait before retrying other errors
-                        time.sleep(2)
+                    status = e.response.status_code
+                    log.warning("      Status code: %s", status)
+                if status is not None and 400 <= status < 500 and status != 429:
+                    # Auth, permission and not-found errors will not clear up on retry
+                    raise IssueListingError(f"Could not fetch the issues list for org {org_id}: HTTP {status}") from e
+                if attempt >= self.max_attempts:
+                    raise IssueListingError(f"Could not fetch the issues list for org {org_id} "
+                                            f"after {self.max_attempts} attempts") from e
+                if status == 429:  # Rate limited
+                    log.warning("      🚫 Rate limited by Snyk - waiting 61 seconds...")
+                    time.sleep(61)  # Snyk requires at least 61 seconds
+                elif status is not None and status >= 500:  # Server error
+                    log.warning("      Server error - waiting 2 seconds...")
+                    time.sleep(2)
                 else:
                     # Wait before retrying connection errors
                     time.sleep(2)
-                continue
         return {'data': all_data}
 
     def get_all_orgs(self, group_id: str, version: str = "2024-10-15") -> list:
@@ -158,23 +370,13 @@ class SnykAPI:
         next_params = params
         while next_url:
             try:
-                response = self.session.get(next_url, params=next_params)
+                response = self.session.get(next_url, params=next_params, timeout=self.timeout)
                 response.raise_for_status()
-                data = response.json()
-                all_orgs.extend(data.get('data', []))
-                links = data.get('links', {})
-                next_url = links.get('next')
+                data = _loads(response.content)
+                all_orgs += data.get('data', [])
+                next_url = _absolutize(self.base_url, data.get('links', {}).get('next'))
                 next_params = None
-                if next_url:
-                    if next_url.startswith('http'):
-                        pass
-                    elif next_url.startswith('/'):
-                        next_url = self.base_url + next_url
-                    else:
-                        next_url = self.base_url + '/' + next_url.lstrip('/')
-                else:
-                    next_url = None
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 print(f"   ❌ Error fetching orgs for group {group_id}: {e}")
                 if hasattr(e, 'response') and e.response is not None:
                     print(f"      Status code: {e.response.status_code}")
@@ -191,25 +393,34 @@ class SnykAPI:
                     # Wait before retrying connection errors
                     time.sleep(2)
                 continue
+        for org in all_orgs:
+            slug = org.get('attributes', {}).get('slug')
+            if org.get('id') and slug:
+                self._remember_slug(org['id'], slug)
         return all_orgs
     
     def get_org_slug(self, org_id: str) -> str:
         """
         Fetch the organization slug for a given org_id using the correct version parameter.
+        Slugs are memoized, both in memory and across runs via SLUG_CACHE_FILE.
         """
+        cached = self._slug_cache.get(org_id)
+        if cached:
+            return cached[0]
         url = f"{self.base_url}/rest/orgs/{org_id}"
         params = {'version': '2024-10-15'}
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             slug = data.get('data', {}).get('attributes', {}).get('slug')
             if slug:
+                self._remember_slug(org_id, slug)
                 return slug
             else:
                 print(f"   ⚠️  No slug found for org {org_id}, using org_id as fallback.")
                 return org_id
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"   ⚠️  Could not fetch slug for org {org_id}: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"      Status code: {e.response.status_code}")
@@ -218,7 +429,14 @@ class SnykAPI:
                     time.sleep(61)  # Snyk requires at least 61 seconds
             return org_id
 
-    def get_issue_details(self, org_id: str, project_id: str, issue_id: str, version: str = "2022-04-06~experimental") -> Dict:
+    def cached_issue_details(self, org_id: str, project_id: str, issue_id: str, version: str = "2022-04-06~experimental") -> Optional[Dict]:
+        """Return issue details from the detail cache without calling the API, or None."""
+        if self.detail_cache is None:
+            return None
+        return self.detail_cache.get(org_id, project_id, issue_id, version)
+
+    def get_issue_details(self, org_id: str, project_id: str, issue_id: str, version: str = "2022-04-06~experimental",
+                          log: Optional[logging.Logger] = None) -> Dict:
         """
         Fetch detailed information for a specific code issue.
         Args:
@@ -226,190 +444,865 @@ class SnykAPI:
             project_id: Project ID (scan_item)
             issue_id: Issue problem ID (from attributes.problems[0].id for issue details API)
             version: API version (default: 2022-04-06~experimental - required for issue details)
+            log: Logger for retry and error messages (the module logger by default)
         Returns:
-            Dictionary containing the issue details
+            Dictionary containing the issue details, or None if they could not be fetched.
+            Rate limited (429), server error (5xx), timeout and connection failures are
+            retried up to max_attempts times with jittered exponential backoff.
         """
+        details = self.cached_issue_details(org_id, project_id, issue_id, version)
+        if details is not None:
+            return details
+        
+        log = log or logger
         url = f"{self.base_url}/rest/orgs/{org_id}/issues/detail/code/{issue_id}"
         params = {
             'project_id': project_id,
             'version': version
         }
+        for attempt in range(self.max_attempts):
+            try:
+                response = self.detail_session.get(url, params=params, timeout=self.timeout)
+                if response.status_code == 429:  # Rate limited
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    log.warning("      🚫 Rate limited by Snyk - waiting %.0f seconds...", retry_after)
+                    time.sleep(retry_after)
+                    continue
+                if response.status_code in RETRY_STATUSES:  # Server error
+                    delay = _backoff_delay(attempt)
+                    log.warning("      Server error %d - retrying in %.1f seconds...", response.status_code, delay)
+                    time.sleep(delay)
+                    continue
+                response.raise_for_status()
+                details = _loads(response.content)
+                if self.detail_cache is not None:
+                    self.detail_cache.set(org_id, project_id, issue_id, version, details)
+                return details
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                delay = _backoff_delay(attempt)
+                log.warning("   ❌ Error fetching issue details: %s - retrying in %.1f seconds...", e, delay)
+                time.sleep(delay)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                log.warning("   ❌ Error fetching issue details: %s", e)
+                if hasattr(e, 'response') and e.response is not None:
+                    log.warning("      Status code: %s", e.response.status_code)
+                return None
+        
+        log.warning("   ❌ Giving up on issue %s after %d attempts", issue_id, self.max_attempts)
+        return None
+
+
+class RequestPacer:
+    """
+    Thread-safe pacing for the requests-based client: request starts are spaced
+    at least interval seconds apart (plus up to 10% jitter) across every thread
+    sharing the pacer, so a thread pool keeps the same overall rate as a serial loop.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until this thread's request slot comes up."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            # Add jitter to rate limiting to prevent thundering herd
+            self._next_slot = slot + self.interval + random.uniform(0, self.interval * 0.1)
+        time.sleep(slot - now)
+
+
+class AdaptiveLimiter:
+    """
+    Async context manager bounding in-flight requests to Snyk's advertised rate limit.
+
+    The concurrency limit grows by one after every successful response (up to
+    max_concurrency), drops to X-RateLimit-Remaining when the server reports a
+    smaller budget, and is halved once per rate-limit window: the first 429 halves it
+    and holds new requests back until Retry-After has elapsed, and further 429s from
+    the same burst are ignored. Request starts are additionally paced to
+    at most `rate` per second when a rate is given.
+    """
+
+    def __init__(self, max_concurrency: int = 64, rate: float = 0.0):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.rate = rate
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._next_start = 0.0
+        self._paused_until = 0.0
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"   ❌ Error fetching issue details: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"      Status code: {e.response.status_code}")
-                if e.response.status_code == 429:  # Rate limited
-                    print(f"      🚫 Rate limited by Snyk - waiting 61 seconds...")
-                    time.sleep(61)  # Snyk requires at least 61 seconds
-                elif e.response.status_code >= 500:  # Server error
-                    print(f"      Server error - waiting 2 seconds...")
-                    time.sleep(2)
-            return None
+            await self._pace()
+        except BaseException:
+            await self._release()
+            raise
+        return self
 
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._release()
 
-def process_org_issues(snyk_api: SnykAPI, org_id: str, org_slug: str, verbose: bool = False, debug: bool = False, rate_limit: float = 0.1) -> Dict:
+    async def _release(self):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def _pace(self):
+        """Wait out any rate-limit pause, then take the next start slot from the token bucket."""
+        loop = asyncio.get_running_loop()
+        while loop.time() < self._paused_until:
+            await asyncio.sleep(self._paused_until - loop.time())
+        if self.rate <= 0:
+            return
+        now = loop.time()
+        start = max(now, self._next_start)
+        interval = 1.0 / self.rate
+        self._next_start = start + interval + random.uniform(0, interval * 0.1)  # 10% jitter
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def update(self, status: int, headers) -> float:
+        """
+        Feed a response's status and rate-limit headers back into the limiter.
+        Returns the number of seconds new requests are paused for if this response
+        started a new backoff window, otherwise 0.
+        """
+        if status == 429:
+            loop = asyncio.get_running_loop()
+            # Requests that were already in flight when the window started get 429s
+            # too; only the first one halves the limit and starts the pause
+            if loop.time() < self._paused_until:
+                return 0.0
+            self.limit = max(1, self.limit // 2)
+            retry_after = _parse_retry_after(headers.get('Retry-After'))
+            self._paused_until = loop.time() + retry_after
+            return retry_after
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit() and int(remaining) < self.limit:
+            self.limit = max(1, int(remaining))
+        elif status < 400 and self.limit < self.max_concurrency:
+            self.limit += 1
+        return 0.0
+
+
+class AsyncSnykAPI:
     """
-    Process all code issues for a single organization and return vulnerable lines summary.
-    Returns: {severity: line_count, total: total_count}
+    Asynchronous Snyk API client used to fan out issue detail requests.
+
+    A single HTTP client is shared for the lifetime of the client so that all
+    detail requests reuse the same keep-alive connections, and every request goes
+    through an AdaptiveLimiter so concurrency follows Snyk's limits. By default
+    the client is an aiohttp session (HTTP/1.1 connection pool); with http2=True
+    it is an httpx client that multiplexes requests over one HTTP/2 connection.
+    """
+
+    def __init__(self, token: str, base_url: str, max_concurrency: int = 64,
+                 rate: float = 0.0, timeout: int = 60, max_attempts: int = 5,
+                 http2: bool = False, detail_cache: Optional[IssueDetailCache] = None):
+        self.token = token
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.http2 = http2
+        self.detail_cache = detail_cache
+        self.session = None
+        self.limiter = None
+        self._transport_errors = ()
+
+    async def __aenter__(self):
+        headers = {
+            'Authorization': f'token {self.token}',
+            'Accept': 'application/vnd.api+json',
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
+        if self.http2:
+            self.session = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+                timeout=httpx.Timeout(self.timeout, connect=30),
+                headers=headers
+            )
+            self._transport_errors = (httpx.HTTPError,)
+        else:
+            # Every request goes to the one Snyk API host: cache its DNS answer and keep
+            # idle connections around long enough to be reused between pages and orgs
+            connector = aiohttp.TCPConnector(
+                limit=max(100, self.max_concurrency),
+                limit_per_host=self.max_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(sock_connect=30, sock_read=self.timeout),
+                headers=headers
+            )
+            self._transport_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        self.limiter = AdaptiveLimiter(self.max_concurrency, self.rate)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.http2:
+            await self.session.aclose()
+        else:
+            await self.session.close()
+
+    async def _request(self, url: str, params: Optional[Dict]) -> Tuple[int, Dict, bytes]:
+        """Send a GET with the active HTTP client. Returns (status, headers, body)."""
+        if self.http2:
+            response = await self.session.get(url, params=params)
+            return response.status_code, response.headers, response.content
+        async with self.session.get(url, params=params) as response:
+            return response.status, response.headers, await response.read()
+
+    async def _get_json(self, url: str, params: Optional[Dict], description: str,
+                        log: Optional[logging.Logger] = None) -> Optional[Dict]:
+        """
+        GET a JSON document through the adaptive limiter.
+        Rate limited (429), server error (5xx) and connection failures are retried
+        with exponential backoff. Returns None on other errors or once retries run out.
+        Errors are reported through log (the module logger by default).
+        """
+        log = log or logger
+        for attempt in range(self.max_attempts):
+            try:
+                async with self.limiter:
+                    status, headers, body = await self._request(url, params)
+                    paused_for = self.limiter.update(status, headers)
+                if status < 400:
+                    return _loads(body)
+            except (*self._transport_errors, ValueError) as e:
+                log.warning("   ❌ Error fetching %s: %r", description, e)
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            
+            if status == 429:  # Rate limited
+                if paused_for:
+                    log.warning("      🚫 Rate limited by Snyk - pausing %.0f seconds (concurrency now %d)...",
+                                paused_for, self.limiter.limit)
+                await asyncio.sleep(_backoff_delay(attempt))
+            elif status >= 500:  # Server error
+                await asyncio.sleep(_backoff_delay(attempt))
+            else:
+                log.warning("   ❌ Error fetching %s: HTTP %d", description, status)
+                return None
+        
+        log.warning("   ❌ Giving up fetching %s after %d attempts", description, self.max_attempts)
+        return None
+
+    async def iter_issues_for_org(self, org_id: str, issue_type: str = "code", version: str = "2024-10-15",
+                                  log: Optional[logging.Logger] = None):
+        """
+        Yield pages (lists) of issues for a single Snyk organization, following pagination links.
+        Raises IssueListingError if a page cannot be fetched, so a partial list is
+        never mistaken for the complete one.
+        """
+        next_url = f"{self.base_url}/rest/orgs/{org_id}/issues"
+        next_params = {
+            'version': version,
+            'type': issue_type,
+            'limit': 100,
+            'status': 'open'
+        }
+        while next_url:
+            data = await self._get_json(next_url, next_params, f"issues for org {org_id}", log)
+            if data is None:
+                raise IssueListingError(f"Could not fetch the issues list for org {org_id}")
+            yield data.get('data', [])
+            next_url = _absolutize(self.base_url, data.get('links', {}).get('next'))
+            next_params = None
+
+    async def get_issue_details(self, org_id: str, project_id: str, issue_id: str, version: str = "2022-04-06~experimental",
+                                log: Optional[logging.Logger] = None) -> Optional[Dict]:
+        """
+        Fetch detailed information for a specific code issue.
+        Same contract as SnykAPI.get_issue_details, with retries handled by _get_json.
+        """
+        if self.detail_cache is not None:
+            details = self.detail_cache.get(org_id, project_id, issue_id, version)
+            if details is not None:
+                return details
+        
+        url = f"{self.base_url}/rest/orgs/{org_id}/issues/detail/code/{issue_id}"
+        params = {
+            'project_id': project_id,
+            'version': version
+        }
+        details = await self._get_json(url, params, f"issue details for {issue_id}", log)
+        if details is not None and self.detail_cache is not None:
+            self.detail_cache.set(org_id, project_id, issue_id, version, details)
+        return details
+
+
+class _BatchedStreamHandler(logging.handlers.BufferingHandler):
+    """
+    Hold log records in memory and write them to a stream in a single call.
+    The buffer is written out when it fills up or when a record at flush_level or
+    above arrives, so per-issue DEBUG lines are batched while progress still shows.
     """
-    print(f"🔍 Processing organization: {org_slug} ({org_id})")
+
+    def __init__(self, stream: TextIO, capacity: int = 10000, flush_level: int = logging.INFO):
+        super().__init__(capacity)
+        self.stream = stream
+        self.flush_level = flush_level
+        self.setFormatter(logging.Formatter('%(message)s'))
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return len(self.buffer) >= self.capacity or record.levelno >= self.flush_level
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                self.stream.write(''.join(self.format(record) + '\n' for record in self.buffer))
+                self.stream.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+
+@contextlib.contextmanager
+def _org_logger(org_id: str, stream: Optional[TextIO] = None):
+    """
+    Yield the logger used for one organization's processing output.
+    Messages are formatted only when written, and everything still buffered is
+    written to stream (stdout by default) when the block exits.
+    """
+    org_log = logger.getChild(org_id)
+    org_log.setLevel(logging.DEBUG)
+    org_log.propagate = False
+    handler = _BatchedStreamHandler(stream if stream is not None else sys.stdout)
+    org_log.addHandler(handler)
+    try:
+        yield org_log
+    finally:
+        org_log.removeHandler(handler)
+        handler.close()
+
+
+def _save_debug_issues(issues: List[Dict], org_id: str, org_slug: str, log: logging.Logger):
+    """Save all collected issues to a file for debugging (only with --debug flag)."""
+    debug_filename = f"debug_issues_{org_slug}_{org_id[:8]}.json"
+    try:
+        with open(debug_filename, 'wb') as f:
+            f.write(_dumps({'data': issues}))
+        log.info("   🔍 Debug: Saved all %d issues to %s", len(issues), debug_filename)
+    except Exception as e:
+        log.warning("   ⚠️  Could not save debug file: %s", e)
+
+
+def _print_sample_issues(issues: List[Dict], log: logging.Logger):
+    """Log the first couple of issues (only with --verbose flag)."""
+    log.debug("   [DEBUG] Sample issues:")
+    for i, issue in enumerate(issues[:2]):
+        attrs = issue.get('attributes', {})
+        log.debug("   [DEBUG] Issue %d: id=%s key=%s title=%s",
+                  i + 1, issue.get('id'), attrs.get('key'), attrs.get('title', 'No title'))
+
+
+def _fetch_org_issues(snyk_api: SnykAPI, org_id: str, org_slug: str, log: logging.Logger, verbose: bool = False, debug: bool = False) -> List[Tuple]:
+    """
+    Fetch all open code issues for an organization, reduced to _slim_issue tuples.
+    Saves the raw issues to a debug file with --debug, which is the only mode that
+    holds every full issue payload in memory; --verbose keeps just the logged sample.
+    """
+    sample_issues = []
+
+    def slim_and_sample(issue: Dict) -> Tuple:
+        if len(sample_issues) < 2:
+            sample_issues.append(issue)
+        return _slim_issue(issue)
+
+    if debug:
+        transform = None
+    elif verbose:
+        transform = slim_and_sample
+    else:
+        transform = _slim_issue
     
     # Get all code issues for this org
     issues_data = snyk_api.get_issues_for_org(
         org_id=org_id,
         issue_type="code",
-        version="2024-10-15"  # Use latest version for issues endpoint
+        version="2024-10-15",  # Use latest version for issues endpoint
+        transform=transform,
+        log=log
     )
     
     issues = issues_data.get('data', [])
-    print(f"   📋 Found {len(issues)} code issues")
+    log.info("   📋 Found %d code issues", len(issues))
     
-    # Save all collected issues to file for debugging (only with --debug flag)
-    if debug:
-        debug_filename = f"debug_issues_{org_slug}_{org_id[:8]}.json"
-        try:
-            with open(debug_filename, 'w') as f:
-                json.dump(issues_data, f, indent=2)
-            print(f"   🔍 Debug: Saved all {len(issues)} issues to {debug_filename}")
-        except Exception as e:
-            print(f"   ⚠️  Could not save debug file: {e}")
+    if not debug:
+        if sample_issues:
+            _print_sample_issues(sample_issues, log)
+        return issues
+    
+    _save_debug_issues(issues, org_id, org_slug, log)
     
     if verbose and issues:
-        print(f"   [DEBUG] Sample issues:")
-        for i, issue in enumerate(issues[:2]):
-            attrs = issue.get('attributes', {})
-            main_id = issue.get('id')
-            key_id = attrs.get('key')
-            print(f"   [DEBUG] Issue {i+1}: id={main_id} key={key_id} title={attrs.get('title', 'No title')}")
+        _print_sample_issues(issues, log)
+    
+    slim_issues = []
+    for i, issue in enumerate(issues, 1):
+        slim = _slim_issue(issue)
+        # Issues without a listed line range go through the issue details API
+        if slim[3] is None:
+            _log_issue_ids(issue, i, org_id, slim[1], slim[2], log)
+        slim_issues.append(slim)
+    return slim_issues
+
+
+def _dig(obj, *path, default=None):
+    """
+    Follow a path of dict keys and list indices into a parsed JSON document.
+    Returns default as soon as a step is missing, without building throwaway
+    empty dicts at every level the way chained .get(key, {}) calls do.
+    """
+    try:
+        for key in path:
+            obj = obj[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+    return obj
+
+
+def _issue_ids(issue: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get (project_id, issue_id) from an issues-list entry.
+    Subscripts the layout the issues API returns directly, and only walks the
+    paths with _dig when an issue does not match it (e.g. no problems entry).
+    """
+    try:
+        return issue['relationships']['scan_item']['data']['id'], issue['attributes']['problems'][0]['id']
+    except (KeyError, IndexError, TypeError):
+        return (_dig(issue, 'relationships', 'scan_item', 'data', 'id'),
+                _dig(issue, 'attributes', 'problems', 0, 'id'))
+
+
+def _extract_issue_ids(issue: Dict, index: int, org_id: str, log: logging.Logger, debug: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract the (project_id, issue_id) pair needed by the issue details API.
+    """
+    # Extract exactly as specified:
+    # org_id: relationships.organization.data.id (we already have this as parameter)
+    # project_id: relationships.scan_item.data.id  
+    # issue_id: attributes.problems[0].id
+    project_id, issue_id = _issue_ids(issue)
+    
+    # Debug: Print extracted values according to specification (only with --debug flag)
+    if debug:
+        _log_issue_ids(issue, index, org_id, project_id, issue_id, log)
+    
+    return project_id, issue_id
+
+
+def _log_issue_ids(issue: Dict, index: int, org_id: str, project_id: Optional[str], issue_id: Optional[str], log: logging.Logger):
+    """Log the IDs extracted from an issue and the details URL they lead to (only with --debug flag)."""
+    title = _dig(issue, 'attributes', 'title', default='No title')
+    org_id_from_issue = _dig(issue, 'relationships', 'organization', 'data', 'id')
+    log.debug("   [DEBUG] Issue %d:\n"
+              "           Title:                    %s\n"
+              "           org_id (from param):      %s\n"
+              "           org_id (from issue):      %s\n"
+              "           project_id (scan_item):   %s\n"
+              "           issue_id (problems[0]):   %s\n"
+              "           API URL will be: /orgs/%s/issues/detail/code/%s?project_id=%s\n",
+              index, title, org_id, org_id_from_issue, project_id, issue_id, org_id, issue_id, project_id)
+
+
+# Severity buckets, in the order they are stored in a line-count tally
+SEVERITIES = ('high', 'medium', 'low')
+# Tally slot for each severity, keyed by every spelling the API is known to use
+# so the common case is a single dict lookup with no lower() copy
+_SEVERITY_INDEX = {variant: i for i, severity in enumerate(SEVERITIES)
+                   for variant in (severity, severity.upper(), severity.capitalize())}
+
+
+def _new_tally() -> List[int]:
+    """Create an empty tally of vulnerable lines, one slot per entry in SEVERITIES."""
+    return [0] * len(SEVERITIES)
+
+
+def _tally_summary(tally: List[int]) -> Dict:
+    """Convert a tally into the {severity: line_count, total: total_count} summary."""
+    summary = dict(zip(SEVERITIES, tally))
+    summary['total'] = sum(tally)
+    return summary
+
+
+def _listed_region(issue: Dict) -> Optional[Tuple[str, int, int]]:
+    """
+    Get (severity, start_line, end_line) straight from an issues-list entry.
+    Returns None when the list payload does not carry the issue's source region,
+    in which case the issue details API has to be used instead.
+    """
+    attributes = issue.get('attributes')
+    region = _dig(attributes, 'coordinates', 0, 'representations', 0, 'sourceLocation', 'region')
+    start_line = _dig(region, 'start', 'line')
+    end_line = _dig(region, 'end', 'line')
+    severity = _dig(attributes, 'effective_severity_level')
+    if start_line and end_line and severity:
+        return severity, start_line, end_line
+    return None
+
+
+def _detail_region(details: Dict) -> Tuple[str, Optional[int], Optional[int]]:
+    """Get (severity, start_line, end_line) from an issue details API response."""
+    attrs = _dig(details, 'data', 'attributes')
+    region = _dig(attrs, 'primaryRegion')
+    severity = _dig(attrs, 'severity', default='unknown')
+    return severity, _dig(region, 'startLine'), _dig(region, 'endLine')
+
+
+def _slim_issue(issue: Dict) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[Tuple[str, int, int]]]:
+    """
+    Reduce an issues-list entry to the fields the serial path needs:
+    (id, project_id, issue_id, listed_region), where listed_region is the
+    _listed_region result (None when the issue details API has to be used).
+    """
+    project_id, issue_id = _issue_ids(issue)
+    return issue.get('id'), project_id, issue_id, _listed_region(issue)
+
+
+def _tally_issue(region: Tuple[str, Optional[int], Optional[int]], issue_id: str, tally: List[int], log: logging.Logger, verbose: bool = False) -> Optional[Tuple[str, int]]:
+    """
+    Add an issue's vulnerable line range, given as (severity, start_line, end_line),
+    to its severity slot in the tally.
+    Returns (severity, vulnerable_lines), or None if the issue had to be skipped.
+    """
+    severity, start_line, end_line = region
+    
+    if not (start_line and end_line):
+        if verbose:
+            log.debug("   ⚠️  Skipping issue %s: missing line range", issue_id)
+        return None
+    
+    # Calculate vulnerable lines count
+    vulnerable_lines = end_line - start_line + 1
+    
+    # Add to appropriate severity bucket
+    index = _SEVERITY_INDEX.get(severity)
+    if index is None:
+        index = _SEVERITY_INDEX.get(severity.lower())
+    if index is None:
+        if verbose:
+            log.debug("   ⚠️  Unknown severity '%s' for issue %s", severity, issue_id)
+        return None
+    tally[index] += vulnerable_lines
+    
+    return SEVERITIES[index], vulnerable_lines
+
+
+def process_org_issues(snyk_api: SnykAPI, org_id: str, org_slug: str, log: logging.Logger, verbose: bool = False, debug: bool = False, rate_limit: float = 0.1, max_workers: int = 1) -> Dict:
+    """
+    Process all code issues for a single organization and return vulnerable lines summary.
+    Used when aiohttp is not available or with --sync. Issue details are fetched by
+    a pool of max_workers threads (one by default, i.e. serially), with request
+    starts spaced rate_limit seconds apart across all of them.
+    Returns: {severity: line_count, total: total_count}
+    """
+    log.info("🔍 Processing organization: %s (%s)", org_slug, org_id)
+    
+    issues = _fetch_org_issues(snyk_api, org_id, org_slug, log, verbose, debug)
     
     # Count vulnerable lines
-    org_vulnerable_lines = {
-        'high': 0,
-        'medium': 0, 
-        'low': 0,
-        'total': 0
-    }
+    tally = _new_tally()
     
     processed_count = 0
     skipped_count = 0
     error_count = 0
+    listed_region_count = 0
+    detail_count = 0
     
-    print(f"   🔄 Processing {len(issues)} issues...")
+    log.info("   🔄 Processing %d issues...", len(issues))
     
-    for i, issue in enumerate(issues, 1):
-        # Progress indicator
-        if i % 25 == 0 or i == len(issues):
-            print(f"   📊 Progress: {i}/{len(issues)} issues processed ({i/len(issues)*100:.1f}%)")
+    pacer = RequestPacer(rate_limit)
+    
+    def fetch_details(project_id: str, issue_id: str) -> Optional[Dict]:
+        pacer.wait()
+        return snyk_api.get_issue_details(org_id, project_id, issue_id, version="2022-04-06~experimental", log=log)
+    
+    def tally_region(region: Tuple[str, Optional[int], Optional[int]], issue_id: str):
+        nonlocal processed_count, skipped_count
+        tallied = _tally_issue(region, issue_id, tally, log, verbose)
+        if tallied is None:
+            skipped_count += 1
+            return
+        
+        processed_count += 1
         
+        if verbose and processed_count <= 3:
+            severity, vulnerable_lines = tallied
+            log.debug("   ✅ Processed issue %s...: %d %s lines", issue_id[:8], vulnerable_lines, severity)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        # Tally what is already known and hand the remaining issues to the pool;
+        # results are tallied here as they complete, so the tally needs no lock
         try:
-            # Add jitter to rate limiting to prevent thundering herd
-            if rate_limit > 0:
-                jitter = random.uniform(0, rate_limit * 0.1)  # 10% jitter
-                time.sleep(rate_limit + jitter)
-            
-            relationships = issue.get('relationships', {})
-            attributes = issue.get('attributes', {})
-            
-            # Extract exactly as specified:
-            # org_id: relationships.organization.data.id (we already have this as parameter)
-            # project_id: relationships.scan_item.data.id  
-            # issue_id: attributes.problems[0].id
-            project_id = relationships.get('scan_item', {}).get('data', {}).get('id')
-            problems = attributes.get('problems', [])
-            issue_id = problems[0].get('id') if problems and len(problems) > 0 else None
-            main_id = issue.get('id')  # Main issue ID for reference
-            
-            # Debug: Print extracted values according to specification (only with --debug flag)
-            if debug:
-                title = attributes.get('title', 'No title')
-                org_id_from_issue = relationships.get('organization', {}).get('data', {}).get('id')
-                print(f"   [DEBUG] Issue {i}:")
-                print(f"           Title:                    {title}")
-                print(f"           org_id (from param):      {org_id}")
-                print(f"           org_id (from issue):      {org_id_from_issue}")  
-                print(f"           project_id (scan_item):   {project_id}")
-                print(f"           issue_id (problems[0]):   {issue_id}")
-                print(f"           API URL will be: /orgs/{org_id}/issues/detail/code/{issue_id}?project_id={project_id}")
-                print()
-            
-            if not (project_id and issue_id):
-                if verbose:
-                    print(f"   ⚠️  Skipping issue {i}: missing project_id or issue_id")
-                skipped_count += 1
-                continue
+            for i, (key, project_id, issue_id, region) in enumerate(issues, 1):
+                try:
+                    # Use the line range from the issues list when present; no API call needed
+                    if region is not None:
+                        listed_region_count += 1
+                        tally_region(region, key or str(i))
+                        continue
+                    
+                    if not (project_id and issue_id):
+                        if verbose:
+                            log.debug("   ⚠️  Skipping issue %d: missing project_id or issue_id", i)
+                        skipped_count += 1
+                        continue
+                    
+                    detail_count += 1
+                    details = snyk_api.cached_issue_details(org_id, project_id, issue_id, version="2022-04-06~experimental")
+                    if details is not None:
+                        tally_region(_detail_region(details), issue_id)
+                    else:
+                        futures[executor.submit(fetch_details, project_id, issue_id)] = (i, issue_id)
+                except Exception as e:
+                    # One malformed issue or cached entry must not abort the org
+                    error_count += 1
+                    if verbose:
+                        log.warning("   ❌ Error processing issue %d: %s", i, e)
             
-            # Get issue details to extract line information
-            details = snyk_api.get_issue_details(org_id, project_id, issue_id, version="2022-04-06~experimental")
-            if details is None:
-                if verbose:
-                    print(f"   ⚠️  Skipping issue {issue_id}: could not fetch details")
-                skipped_count += 1
-                continue
+            for completed, future in enumerate(as_completed(futures), 1):
+                i, issue_id = futures[future]
+                try:
+                    details = future.result()
+                    if details is None:
+                        if verbose:
+                            log.debug("   ⚠️  Skipping issue %s: could not fetch details", issue_id)
+                        skipped_count += 1
+                        continue
+                    tally_region(_detail_region(details), issue_id)
+                except requests.exceptions.ConnectionError as e:
+                    error_count += 1
+                    if verbose:
+                        log.warning("   🔌 Connection error processing issue %d: %s", i, e)
+                except requests.exceptions.Timeout as e:
+                    error_count += 1
+                    if verbose:
+                        log.warning("   ⏰ Timeout processing issue %d: %s", i, e)
+                except Exception as e:
+                    error_count += 1
+                    if verbose:
+                        log.warning("   ❌ Error processing issue %d: %s", i, e)
+                finally:
+                    # Progress indicator
+                    if completed % 25 == 0 or completed == len(futures):
+                        log.info("   📊 Progress: %d/%d issue details fetched (%.1f%%)",
+                                 completed, len(futures), completed / len(futures) * 100)
+        except BaseException:
+            # On Ctrl-C (or a crash) drop the fetches that have not started yet
+            # instead of letting the executor run the whole backlog before exiting
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    log.info("   ⚡ Line ranges: %d from the issues list, %d from issue details", listed_region_count, detail_count)
+    log.info("   ✅ Processed %d issues, skipped %d issues, errors %d issues", processed_count, skipped_count, error_count)
+    return _tally_summary(tally)
+
+
+async def process_org_issues_async(async_api: AsyncSnykAPI, org_id: str, org_slug: str, log: logging.Logger, verbose: bool = False, debug: bool = False) -> Dict:
+    """
+    Process all code issues for a single organization and return vulnerable lines summary.
+
+    Runs as a producer/consumer pipeline: the producer walks the paginated issues
+    list and queues (project_id, issue_id) pairs while a pool of consumers fetches
+    issue details concurrently, so listing and detail fetching overlap. Issues whose
+    line range is already in the list payload are counted by the producer directly.
+    Returns: {severity: line_count, total: total_count}
+    """
+    log.info("🔍 Processing organization: %s (%s)", org_slug, org_id)
+    log.info("   🔄 Processing issues as they are listed...")
+    
+    num_workers = async_api.max_concurrency
+    queue = asyncio.Queue(maxsize=1024)
+    listed_count = 0
+    listed_region_count = 0
+    queued_count = 0
+    listing_done = False
+    completed = 0
+    shown = 0
+    all_issues = []
+    
+    def report_processed(issue_id: str, tallied: Tuple[str, int]):
+        nonlocal shown
+        if verbose and shown < 3:
+            shown += 1
+            severity, vulnerable_lines = tallied
+            log.debug("   ✅ Processed issue %s...: %d %s lines", issue_id[:8], vulnerable_lines, severity)
+    
+    async def producer() -> Tuple[List[int], int, int, int]:
+        nonlocal listed_count, listed_region_count, queued_count, listing_done
+        tally = _new_tally()
+        processed_count = skipped_count = error_count = 0
+        try:
+            async for page in async_api.iter_issues_for_org(org_id, issue_type="code", version="2024-10-15", log=log):
+                if verbose and listed_count == 0 and page:
+                    _print_sample_issues(page, log)
+                if debug:
+                    all_issues.extend(page)
+                for issue in page:
+                    listed_count += 1
+                    
+                    try:
+                        # Use the line range from the issues list when present; no API call needed
+                        region = _listed_region(issue)
+                        if region is not None:
+                            issue_id = issue.get('id', str(listed_count))
+                            listed_region_count += 1
+                            tallied = _tally_issue(region, issue_id, tally, log, verbose)
+                            if tallied is None:
+                                skipped_count += 1
+                            else:
+                                processed_count += 1
+                                report_processed(issue_id, tallied)
+                            continue
+                        
+                        project_id, issue_id = _extract_issue_ids(issue, listed_count, org_id, log, debug)
+                        if not (project_id and issue_id):
+                            if verbose:
+                                log.debug("   ⚠️  Skipping issue %d: missing project_id or issue_id", listed_count)
+                            skipped_count += 1
+                            continue
+                        queued_count += 1
+                        await queue.put((project_id, issue_id))
+                    except Exception as e:
+                        # One malformed issue must not abort the org (or the other orgs)
+                        error_count += 1
+                        if verbose:
+                            log.warning("   ❌ Error processing issue %d: %s", listed_count, e)
+        finally:
+            listing_done = True
+        # One sentinel per consumer so every worker exits once the queue drains. On a
+        # listing error there are none: the workers are cancelled with the queue unread.
+        for _ in range(num_workers):
+            await queue.put(None)
+        return tally, processed_count, skipped_count, error_count
+    
+    async def consumer() -> Tuple[List[int], int, int, int]:
+        nonlocal completed
+        # Each worker tallies locally; results are merged once all workers finish
+        tally = _new_tally()
+        processed_count = skipped_count = error_count = 0
+        while True:
+            item = await queue.get()
+            if item is None:
+                return tally, processed_count, skipped_count, error_count
+            project_id, issue_id = item
+            try:
+                details = await async_api.get_issue_details(org_id, project_id, issue_id, version="2022-04-06~experimental", log=log)
+                if details is None:
+                    if verbose:
+                        log.debug("   ⚠️  Skipping issue %s: could not fetch details", issue_id)
+                    skipped_count += 1
+                    continue
                 
-            # Extract line range and severity
-            attrs = details.get('data', {}).get('attributes', {})
-            region = attrs.get('primaryRegion', {})
-            start_line = region.get('startLine')
-            end_line = region.get('endLine')
-            severity = attrs.get('severity', 'unknown').lower()
-            
-            if not (start_line and end_line):
-                if verbose:
-                    print(f"   ⚠️  Skipping issue {issue_id}: missing line range")
-                skipped_count += 1
-                continue
-            
-            # Calculate vulnerable lines count
-            vulnerable_lines = end_line - start_line + 1
-            
-            # Add to appropriate severity bucket
-            if severity in ['high', 'medium', 'low']:
-                org_vulnerable_lines[severity] += vulnerable_lines
-                org_vulnerable_lines['total'] += vulnerable_lines
-            else:
-                if verbose:
-                    print(f"   ⚠️  Unknown severity '{severity}' for issue {issue_id}")
-                skipped_count += 1
-                continue
+                tallied = _tally_issue(_detail_region(details), issue_id, tally, log, verbose)
+                if tallied is None:
+                    skipped_count += 1
+                    continue
                 
-            processed_count += 1
-            
-            if verbose and processed_count <= 3:
-                print(f"   ✅ Processed issue {issue_id[:8]}...: {vulnerable_lines} {severity} lines")
-        
-        except requests.exceptions.ConnectionError as e:
-            error_count += 1
-            if verbose:
-                print(f"   🔌 Connection error processing issue {i}: {e}")
-            # Wait longer for connection issues
-            time.sleep(2)
-            continue
-        except requests.exceptions.Timeout as e:
-            error_count += 1
-            if verbose:
-                print(f"   ⏰ Timeout processing issue {i}: {e}")
-            # Wait longer for timeout issues
-            time.sleep(3)
-            continue
-        except Exception as e:
-            error_count += 1
-            if verbose:
-                print(f"   ❌ Error processing issue {i}: {e}")
-            continue
-    
-    print(f"   ✅ Processed {processed_count} issues, skipped {skipped_count} issues, errors {error_count} issues")
-    return org_vulnerable_lines
+                processed_count += 1
+                report_processed(issue_id, tallied)
+            except Exception as e:
+                error_count += 1
+                if verbose:
+                    log.warning("   ❌ Error processing issue %s: %s", issue_id, e)
+            finally:
+                # Progress indicator
+                completed += 1
+                if completed % 25 == 0 or (listing_done and completed == queued_count):
+                    if listing_done:
+                        log.info("   📊 Progress: %d/%d issue details fetched (%.1f%%)",
+                                 completed, queued_count, completed / queued_count * 100)
+                    else:
+                        log.info("   📊 Progress: %d issue details fetched (%d issues listed so far)", completed, listed_count)
+    
+    workers = [asyncio.create_task(consumer()) for _ in range(num_workers)]
+    try:
+        producer_result = await producer()
+        results = [producer_result] + await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+    
+    log.info("   📋 Found %d code issues", listed_count)
+    if debug:
+        _save_debug_issues(all_issues, org_id, org_slug, log)
+    
+    # Merge the per-worker tallies
+    tally = _new_tally()
+    processed_count = 0
+    skipped_count = 0
+    error_count = 0
+    for worker_tally, worker_processed, worker_skipped, worker_errors in results:
+        tally = [a + b for a, b in zip(tally, worker_tally)]
+        processed_count += worker_processed
+        skipped_count += worker_skipped
+        error_count += worker_errors
+    
+    log.info("   ⚡ Line ranges: %d from the issues list, %d from issue details", listed_region_count, queued_count)
+    log.info("   ✅ Processed %d issues, skipped %d issues, errors %d issues", processed_count, skipped_count, error_count)
+    return _tally_summary(tally)
+
+
+async def _process_orgs_async(snyk_api: SnykAPI, orgs_to_process: List[Dict], args: argparse.Namespace, max_concurrent_orgs: int = 8) -> List[Optional[Dict]]:
+    """
+    Process organizations concurrently, sharing one AsyncSnykAPI session across all of them.
+    Returns the per-org summaries in the same order as orgs_to_process, with None for
+    organizations whose issues list could not be fetched completely.
+
+    At most max_concurrent_orgs organizations are in progress at once. When more than
+    one org is processed, each org's output is buffered and printed in one block once
+    that org completes, so lines from different orgs do not interleave.
+    """
+    org_semaphore = asyncio.Semaphore(max_concurrent_orgs)
+    buffer_output = len(orgs_to_process) > 1
+    
+    async def process_org(i: int, org_info: Dict) -> Optional[Dict]:
+        out = io.StringIO() if buffer_output else None
+        async with org_semaphore:
+            try:
+                with _org_logger(org_info['id'], out) as log:
+                    log.info("\n[%d/%d] %s", i, len(orgs_to_process), "=" * 50)
+                    try:
+                        # Process this organization
+                        return await process_org_issues_async(async_api, org_info['id'], org_info['slug'],
+                                                              log, args.verbose, args.debug)
+                    except IssueListingError as e:
+                        log.error("   ❌ %s - leaving this organization out of the summary", e)
+                        return None
+            finally:
+                if out is not None:
+                    sys.stdout.write(out.getvalue())
+                    sys.stdout.flush()
+    
+    async with AsyncSnykAPI(snyk_api.token, snyk_api.base_url, max_concurrency=args.max_concurrency,
+                            rate=args.rate, timeout=args.timeout, http2=args.http2,
+                            detail_cache=snyk_api.detail_cache) as async_api:
+        return await asyncio.gather(*[process_org(i, org_info) for i, org_info in enumerate(orgs_to_process, 1)])
 
 
 def save_org_summary_to_file(summary_data: Dict, filename: str):
     """Save organization vulnerable lines summary to a JSON file."""
     try:
-        with open(filename, 'w') as f:
-            json.dump(summary_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps(summary_data))
         print(f"✅ Successfully saved organization vulnerable lines summary to {filename}")
     except Exception as e:
         print(f"❌ Error saving file: {e}")
@@ -456,6 +1349,7 @@ Examples:
   %(prog)s --org-id YOUR_ORG_ID --verbose
   %(prog)s --org-id YOUR_ORG_ID --debug
   %(prog)s --org-id YOUR_ORG_ID --rate-limit 0.2 --timeout 120
+  %(prog)s --group-id YOUR_GROUP_ID --max-concurrency 16 --rate 20
         """
     )
     
@@ -473,10 +1367,23 @@ Examples:
                        help='Show detailed information and debug messages')
     parser.add_argument('--debug', action='store_true',
                        help='Show detailed debugging output for issue extraction')
-    parser.add_argument('--rate-limit', type=float, default=0.1,
-                       help='Rate limiting delay between API calls in seconds (default: 0.1)')
+    parser.add_argument('--rate-limit', type=float,
+                       help='Rate limiting delay between API calls in seconds (default: 0.1 when '
+                            'fetching with requests; when fetching concurrently, sets --rate to its inverse)')
     parser.add_argument('--timeout', type=int, default=60,
                        help='Request timeout in seconds (default: 60)')
+    parser.add_argument('--max-concurrency', type=int, default=64,
+                       help='Maximum concurrent issue detail requests (default: 64)')
+    parser.add_argument('--rate', type=float,
+                       help='Maximum issue detail requests per second when fetching concurrently '
+                            '(default: derived from --rate-limit if given, otherwise no fixed rate; '
+                            'concurrency then follows Snyk\'s rate-limit headers and 429s)')
+    parser.add_argument('--http2', action='store_true',
+                       help='Multiplex concurrent requests over HTTP/2 (requires httpx[http2])')
+    parser.add_argument('--sync', action='store_true',
+                       help='Fetch issue details serially with requests instead of concurrently')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk issue details and org slug caches')
     
     # Add connection resilience info
     parser.add_argument('--help-resilience', action='store_true',
@@ -492,11 +1399,13 @@ Examples:
         print("• Connection pooling to reuse HTTP connections")
         print("• Rate limiting to prevent overwhelming the Snyk API")
         print("• 61-second backoff when Snyk returns 429 (rate limited)")
+        print("• Adaptive concurrency that follows Snyk's rate-limit response headers")
         print("• Jitter in delays to prevent thundering herd problems")
         print("• Specific handling for connection errors and timeouts")
         print("• Configurable timeouts and rate limiting delays")
         print("\nRecommended settings for large organizations:")
         print("• --rate-limit 0.2 (200ms between requests)")
+        print("• --max-concurrency 16 (fewer requests in flight at once)")
         print("• --timeout 120 (2 minutes for slow responses)")
         print("• --verbose (to see progress and error details)")
         print("\nNote: Snyk enforces 61-second backoff on 429 responses")
@@ -521,18 +1430,61 @@ Examples:
     
     # Initialize Snyk API client
     print(f"🔧 Initializing Snyk API client (region: {args.snyk_region})...")
-    snyk_api = SnykAPI(snyk_token, args.snyk_region)
+    snyk_api = SnykAPI(snyk_token, args.snyk_region, slug_cache=not args.no_cache)
     
     # Update timeout if specified
     if args.timeout:
-        snyk_api.session.timeout = (30, args.timeout)
+        snyk_api.timeout = (30, args.timeout)
         print(f"   ⏱️  Request timeout set to {args.timeout} seconds")
     
-    # Show rate limiting info
-    if args.rate_limit > 0:
-        print(f"   🐌 Rate limiting: {args.rate_limit:.3f}s between API calls")
+    # Reuse issue details fetched by recent runs
+    if not args.no_cache:
+        try:
+            snyk_api.detail_cache = IssueDetailCache()
+            print(f"   💾 Issue details cache: {DETAIL_CACHE_FILE} (entries kept {DETAIL_CACHE_TTL // 60} minutes)")
+        except (OSError, sqlite3.Error) as e:
+            print(f"   ⚠️  Issue details cache unavailable, continuing without it: {e}")
+    
+    if args.max_concurrency < 1:
+        print("❌ Error: --max-concurrency must be at least 1")
+        sys.exit(1)
+    
+    if args.http2 and args.sync:
+        print("❌ Error: Cannot specify both --http2 and --sync.")
+        sys.exit(1)
+    
+    if args.http2 and httpx is None:
+        print("❌ Error: --http2 requires httpx with HTTP/2 support (pip install 'httpx[http2]')")
+        sys.exit(1)
+    
+    # Fetch concurrently unless asked not to or no async HTTP client is available
+    use_async = not args.sync and (args.http2 or aiohttp is not None)
+    # Without aiohttp, fall back to a thread pool; keep it within the requests connection pool
+    thread_workers = 1 if args.sync else min(args.max_concurrency, 32)
+    
+    # Concurrent fetching is paced in requests per second, and only when asked to:
+    # by default the AdaptiveLimiter follows Snyk's rate-limit headers and 429s
+    if args.rate is None:
+        args.rate = 1 / args.rate_limit if args.rate_limit else 0.0
+    # The requests-based path keeps its fixed delay between calls
+    if args.rate_limit is None:
+        args.rate_limit = 0.1
+    
+    # Show rate limiting info for the path that will actually run
+    if use_async:
+        transport = "HTTP/2" if args.http2 else "HTTP/1.1"
+        print(f"   🚀 Concurrency: up to {args.max_concurrency} requests in flight over {transport}")
+        if args.rate > 0:
+            print(f"   🐌 Rate limiting: up to {args.rate:.1f} requests/s")
+        else:
+            print(f"   📉 Rate limiting: adaptive, following Snyk's rate-limit headers")
     else:
-        print(f"   ⚡ No rate limiting (not recommended for large orgs)")
+        if thread_workers > 1:
+            print(f"   🚀 Concurrency: up to {thread_workers} requests in flight on worker threads")
+        if args.rate_limit > 0:
+            print(f"   🐌 Rate limiting: {args.rate_limit:.3f}s between API calls")
+        else:
+            print(f"   ⚡ No rate limiting (not recommended for large orgs)")
     
     print(f"   🚫 Snyk 429 handling: 61-second automatic backoff")
     
@@ -564,20 +1516,32 @@ Examples:
     
     # Process each organization
     print(f"\n🔎 Processing {len(orgs_to_process)} organization(s)...")
-    all_org_summaries = {}
+
+    if use_async:
+        org_summaries = asyncio.run(_process_orgs_async(snyk_api, orgs_to_process, args))
+    else:
+        if not args.sync:
+            print("   ⚠️  aiohttp is not installed - fetching issue details on worker threads")
+        org_summaries = []
+
+        for i, org_info in enumerate(orgs_to_process, 1):
+            with _org_logger(org_info['id']) as log:
+                log.info("\n[%d/%d] %s", i, len(orgs_to_process), "=" * 50)
+
+                # Process this organization
+                try:
+                    org_summaries.append(process_org_issues(snyk_api, org_info['id'], org_info['slug'],
+                                                            log, args.verbose, args.debug, args.rate_limit,
+                                                            thread_workers))
+                except IssueListingError as e:
+                    log.error("   ❌ %s - leaving this organization out of the summary", e)
+                    org_summaries.append(None)
     
-    for i, org_info in enumerate(orgs_to_process, 1):
-        org_id = org_info['id']
-        org_slug = org_info['slug']
-        
-        print(f"\n[{i}/{len(orgs_to_process)}] " + "="*50)
-        
-        # Process this organization
-        org_summary = process_org_issues(snyk_api, org_id, org_slug, args.verbose, args.debug, args.rate_limit)
-        
-        # Create organization key: "org-slug (org-id)"
-        org_key = f"{org_slug} ({org_id})"
-        all_org_summaries[org_key] = org_summary
+    # Create organization keys: "org-slug (org-id)"
+    org_keys = [f"{org_info['slug']} ({org_info['id']})" for org_info in orgs_to_process]
+    # Orgs whose issues could not be listed have no summary rather than an undercount
+    all_org_summaries = {key: summary for key, summary in zip(org_keys, org_summaries) if summary is not None}
+    failed_org_keys = [key for key, summary in zip(org_keys, org_summaries) if summary is None]
     
     # Display summary
     display_org_summary(all_org_summaries, args.verbose)
@@ -592,6 +1556,12 @@ Examples:
         default_filename = f"org_vulnerable_lines_{mode}_{timestamp}.json"
         save_org_summary_to_file(all_org_summaries, default_filename)
     
+    if failed_org_keys:
+        print(f"\n❌ Could not list the issues of {len(failed_org_keys)} organization(s); they are not in the summary:")
+        for org_key in failed_org_keys:
+            print(f"   • {org_key}")
+        sys.exit(1)
+    
     print(f"\n🎉 Organization vulnerable lines analysis completed successfully!")
 
 